@@ -3,7 +3,9 @@ import pandas as pd
 from matplotlib.collections import LineCollection
 
 from pyheatintegration import (PinchAnalyzer, Stream, StreamState, StreamType,
-                               convert_to_excel_data, extract_x, y_range)
+                               convert_to_excel_data,
+                               convert_to_line_collection_data, extract_x,
+                               y_range)
 from pyheatintegration.streams import RefrigerantWater, RefrigerantMinus33
 
 
@@ -72,8 +74,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram.png")
 
@@ -83,8 +85,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines), colors="#1f77b4"))
     ax.vlines(heats, ymin=ymin, ymax=ymax, linestyles=':', colors='k')
     ax.autoscale()
     fig.savefig("./tq_diagram_with_vlines.png")
@@ -96,8 +98,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_separated, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_separated, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_separated), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_separated), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram_separated.png")
 
@@ -107,8 +109,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_separated, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_separated, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_separated), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_separated), colors="#1f77b4"))
     ax.vlines(heats_separated, ymin=ymin, ymax=ymax, linestyles=':', colors='gray')
     ax.autoscale()
     fig.savefig("./tq_diagram_separated_with_vlines.png")
@@ -120,8 +122,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_split, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_split, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_split), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_split), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram_split.png")
 
@@ -131,8 +133,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_split, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_split, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_split), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_split), colors="#1f77b4"))
     ax.vlines(heats_split, ymin=ymin, ymax=ymax, linestyles=':', colors='gray')
     ax.autoscale()
     fig.savefig("./tq_diagram_split_with_vlines.png")
@@ -144,8 +146,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_merged, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_merged, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_merged), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_merged), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram_merged.png")
 
@@ -155,8 +157,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_merged, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_merged, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_merged), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_merged), colors="#1f77b4"))
     ax.vlines(heats_merged, ymin=ymin, ymax=ymax, linestyles=':', colors='gray')
     ax.autoscale()
     fig.savefig("./tq_diagram_merged_with_vlines.png")
@@ -3,7 +3,9 @@ import pandas as pd
 from matplotlib.collections import LineCollection
 
 from pyheatintegration import (PinchAnalyzer, Stream, StreamState, StreamType,
-                               convert_to_excel_data, extract_x, y_range)
+                               convert_to_excel_data,
+                               convert_to_line_collection_data, extract_x,
+                               y_range)
 
 
 def main():
@@ -67,8 +69,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram.png")
 
@@ -78,8 +80,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines), colors="#1f77b4"))
     ax.vlines(heats, ymin=ymin, ymax=ymax, linestyles=':', colors='k')
     ax.autoscale()
     fig.savefig("./tq_diagram_with_vlines.png")
@@ -91,8 +93,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_separated, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_separated, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_separated), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_separated), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram_separated.png")
 
@@ -102,8 +104,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_separated, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_separated, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_separated), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_separated), colors="#1f77b4"))
     ax.vlines(heats_separated, ymin=ymin, ymax=ymax, linestyles=':', colors='gray')
     ax.autoscale()
     fig.savefig("./tq_diagram_separated_with_vlines.png")
@@ -115,8 +117,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_split, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_split, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_split), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_split), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram_split.png")
 
@@ -126,8 +128,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_split, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_split, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_split), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_split), colors="#1f77b4"))
     ax.vlines(heats_split, ymin=ymin, ymax=ymax, linestyles=':', colors='gray')
     ax.autoscale()
     fig.savefig("./tq_diagram_split_with_vlines.png")
@@ -139,8 +141,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_merged, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_merged, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_merged), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_merged), colors="#1f77b4"))
     ax.autoscale()
     fig.savefig("./tq_diagram_merged.png")
 
@@ -150,8 +152,8 @@ def main():
     fig, ax = plt.subplots(1, 1)
     ax.set_xlabel("Q [kW]")
     ax.set_ylabel("T [℃]")
-    ax.add_collection(LineCollection(hot_lines_merged, colors="#ff7f0e"))
-    ax.add_collection(LineCollection(cold_lines_merged, colors="#1f77b4"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(hot_lines_merged), colors="#ff7f0e"))
+    ax.add_collection(LineCollection(convert_to_line_collection_data(cold_lines_merged), colors="#1f77b4"))
     ax.vlines(heats_merged, ymin=ymin, ymax=ymax, linestyles=':', colors='gray')
     ax.autoscale()
     fig.savefig("./tq_diagram_merged_with_vlines.png")
@@ -23,9 +23,12 @@ class BaseRange(ABC):
         delta (float): 範囲の大きさ。
     """
 
+    __slots__ = ('start', 'finish', 'delta', '_hash')
+
     def __init__(self, start: float, finish: float):
         self.start, self.finish = minmax(start, finish)
         self.delta = self.finish - self.start
+        self._hash = hash((self.start, self.finish))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.start}, {self.finish})"
@@ -70,7 +73,7 @@ class BaseRange(ABC):
         return self.start >= other.start
 
     def __hash__(self) -> int:
-        return hash((self.start, self.finish))
+        return self._hash
 
     def __call__(self) -> tuple[float, float]:
         return self.start, self.finish
@@ -109,6 +112,7 @@ class BaseRange(ABC):
         """
         self.start += delta
         self.finish += delta
+        self._hash = hash((self.start, self.finish))
 
     def mergeable(self, other: BaseRange) -> bool:
         """結合可能かを返します。
@@ -161,9 +165,12 @@ def merge(range_: T, other: T) -> T:
 
     cls = type(range_)
 
-    if range_.start == other.finish:
-        return cls(other.start, range_.finish)
-    return cls(range_.start, other.finish)
+    # 結合可能であれば端点のmin/maxが結合後の範囲となるため、どちらの端が接しているかで
+    # 分岐する必要はない。
+    return cls(
+        range_.start if range_.start < other.start else other.start,
+        range_.finish if range_.finish > other.finish else other.finish
+    )
 
 
 def is_continuous(
@@ -180,11 +187,14 @@ def is_continuous(
             値をタプルで返します。
     """
     ranges = sorted(ranges_)
-    for i in range(len(ranges)):
-        if i != len(ranges) - 1:
-            if ranges[i].finish != ranges[i + 1].start:
-                return ranges[i].finish, ranges[i + 1].start
-    return None
+    return next(
+        (
+            (range_.finish, next_range.start)
+            for range_, next_range in zip(ranges, ranges[1:])
+            if range_.finish != next_range.start
+        ),
+        None
+    )
 
 
 def flatten(ranges_: list[T]) -> list[float]:
@@ -200,18 +210,20 @@ def flatten(ranges_: list[T]) -> list[float]:
         ValueError: 領域が連続でない場合。
     """
     ranges = sorted(ranges_)
-    if (values := is_continuous(ranges)) is not None:
-        raise ValueError(
-            f'終了値と開始値が異なります。'
-            f'終了値: {values[0]:.3f} '
-            f'開始値: {values[1]:.3f}'
-        )
-
-    res: list[float] = []
-    for i in range(len(ranges)):
-        res.append(ranges[i].start)
-        if i == len(ranges) - 1:
-            res.append(ranges[i].finish)
+    if not ranges:
+        return []
+
+    # 連続性の検証と値の取り出しを一度の走査で行う。
+    res: list[float] = [ranges[0].start]
+    for range_, next_range in zip(ranges, ranges[1:]):
+        if range_.finish != next_range.start:
+            raise ValueError(
+                f'終了値と開始値が異なります。'
+                f'終了値: {range_.finish:.3f} '
+                f'開始値: {next_range.start:.3f}'
+            )
+        res.append(range_.finish)
+    res.append(ranges[-1].finish)
 
     return res
 
@@ -230,4 +242,4 @@ def get_ranges(
         list[T]: 領域のリスト。
     """
     values = sorted(values)
-    return [cls(values[i], values[i + 1]) for i in range(len(values) - 1)]
+    return [cls(start, finish) for start, finish in zip(values, values[1:])]
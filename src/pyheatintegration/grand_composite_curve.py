@@ -1,7 +1,9 @@
 from collections import defaultdict
 from copy import deepcopy
+from itertools import accumulate
+from operator import attrgetter, methodcaller
 
-from .streams import Stream, get_temperature_range_streams
+from .streams import Stream, get_temperature_range_lacking_heats
 from .temperature_range import TemperatureRange, flatten_temperature_ranges
 
 
@@ -34,22 +36,30 @@ class GrandCompositeCurve:
             if stream.is_cold():
                 stream.shift_temperature(self.minimum_approach_temp_diff)
 
-        streams.sort(key=lambda stream: stream.input_temperature())
+        streams.sort(key=methodcaller('input_temperature'))
 
         self.external_streams = [
             stream for stream in streams if stream.is_external()
         ]
 
-        temp_ranges, temp_range_streams = get_temperature_range_streams([
+        # 温度領域ごとの流体の集合を構築せず、不足熱量を直接集計する。温度領域は昇順で
+        # 返される。
+        temp_ranges, lacking_heats = get_temperature_range_lacking_heats([
             stream for stream in streams if stream.is_internal()
         ])
-        temp_ranges.sort()
 
         self.temps = flatten_temperature_ranges(temp_ranges)
-        self.heats = _get_heats(temp_ranges, temp_range_streams)
-
+        heats = list(accumulate(
+            (-lacking_heat for lacking_heat in lacking_heats),
+            initial=0.0
+        ))
+        min_heat = min(heats)
+        self.heats = [heat - min_heat for heat in heats]
+
+        # heat - min_heat == 0とheat == min_heatは同値であるため、シフト前の値から
+        # ピンチポイントを求めてリストの走査を1回減らす。
         self.pinch_points = [
-            (i, self.temps[i]) for i, heat in enumerate(self.heats) if heat == 0
+            (i, self.temps[i]) for i, heat in enumerate(heats) if heat == min_heat
         ]
 
     def pinch_point_temp(self) -> float:
@@ -120,7 +130,7 @@ class GrandCompositeCurve:
         heated = 0.0
         not_heated = heats[-1]
 
-        streams.sort(key=lambda stream: stream.cost)
+        streams.sort(key=attrgetter('cost'))
         for stream in streams:
             # すでに交換熱量が設定されている場合にはスキップする。
             if stream.heat() != 0:
@@ -185,9 +195,11 @@ def _get_heats(
     temp_range_lacking_heat = _get_lacking_heats(temp_range_streams)
 
     temp_ranges.sort()
-    heats = [0.0] * (len(temp_ranges) + 1)
-    for i, temp_range in enumerate(temp_ranges):
-        heats[i + 1] = heats[i] - temp_range_lacking_heat[temp_range]
+    # 添字を介した逐次加算の代わりにaccumulateで累積する。
+    heats = list(accumulate(
+        (-temp_range_lacking_heat[temp_range] for temp_range in temp_ranges),
+        initial=0.0
+    ))
     min_heat = min(heats)
 
     return [heat - min_heat for heat in heats]
@@ -205,7 +217,12 @@ def _get_lacking_heats(
     Returns:
         defaultdict[TemperatureRange, float]: 温度領域ごとの過不足熱量。
     """
+    # heat()/is_hot()は属性を返すだけのアクセサであるため、直接参照して一度の走査で
+    # 与熱・受熱の差を集計する。
     return defaultdict(int, {
-        temp_range: sum(s.heat() for s in streams if s.is_hot()) - sum(s.heat() for s in streams if s.is_cold())
+        temp_range: sum(
+            stream.heat_load if stream._is_hot else -stream.heat_load
+            for stream in streams
+        )
         for temp_range, streams in temp_range_streams.items()
     })
@@ -8,6 +8,8 @@ REL_TOL_DIGIT = 9
 class HeatRange(BaseRange):
     """熱量範囲を表すクラス。"""
 
+    __slots__ = ()
+
     def __contains__(self, temp: float, eps: float = 1e-6) -> bool:
         return self.start - eps <= temp <= self.finish + eps
 
@@ -47,6 +49,6 @@ def get_merged_heat_ranges(
     """
     heats: set[float] = set()
     for heat_ranges in heat_ranges_list:
-        heats |= set(flatten_heat_ranges(heat_ranges))
+        heats.update(flatten_heat_ranges(heat_ranges))
 
-    return get_heat_ranges(sorted(list(heats)))
+    return get_heat_ranges(sorted(heats))
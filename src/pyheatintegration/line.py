@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from itertools import chain
+from operator import itemgetter
 
-Line = tuple[tuple[float, float], tuple[float, float]]
+Line = tuple[float, float, float, float]
 
 
 def y_range(lines: list[Line]) -> tuple[float, float]:
@@ -18,12 +18,12 @@ def y_range(lines: list[Line]) -> tuple[float, float]:
             最小値と最大値。
 
     Examples:
-        >>> y_range([((0, 0), (1, 1)), ((1, 1), (2, 2)), ((2, 2), (3, 5)), ((3, 3), (5, 8))])
+        >>> y_range([(0, 0, 1, 1), (1, 1, 2, 2), (2, 2, 3, 5), (3, 3, 5, 8)])
         (0, 8)
     """
     return (
-        min(line[0][1] for line in lines),
-        max(line[1][1] for line in lines)
+        min(line[1] for line in lines),
+        max(line[3] for line in lines)
     )
 
 
@@ -37,10 +37,33 @@ def extract_x(lines: list[Line]) -> list[float]:
         list[float]: x座標の値。
 
     Examples:
-        >>> extract_x([((0, 0), (1, 1)), ((1, 1), (2, 2)), ((2, 2), (3, 5)), ((3, 3), (5, 8))])
+        >>> extract_x([(0, 0, 1, 1), (1, 1, 2, 2), (2, 2, 3, 5), (3, 3, 5, 8)])
         [0, 1, 2, 3, 5]
     """
-    return sorted(list(set(point[0] for point in chain(*lines))))
+    return sorted(set(
+        x for line in lines for x in (line[0], line[2])
+    ))
+
+
+def convert_to_line_collection_data(
+    lines: list[Line]
+) -> list[tuple[tuple[float, float], tuple[float, float]]]:
+    """直線のリストを始点と終点のタプルのリストに変換します。
+
+    matplotlibのLineCollectionに渡す形式です。
+
+    Args:
+        lines (list[Line]): 直線のリスト。
+
+    Returns:
+        list[tuple[tuple[float, float], tuple[float, float]]]:
+            始点と終点のタプルのリスト。
+
+    Examples:
+        >>> convert_to_line_collection_data([(0, 0, 1, 2), (1, 2, 3, 3)])
+        [((0, 0), (1, 2)), ((1, 2), (3, 3))]
+    """
+    return [((line[0], line[1]), (line[2], line[3])) for line in lines]
 
 
 def convert_to_excel_data(lines_: list[Line]) -> tuple[list[float], list[float]]:
@@ -54,22 +77,29 @@ def convert_to_excel_data(lines_: list[Line]) -> tuple[list[float], list[float]]
             x座標のリストとy座標のリスト
 
     Examples:
-        >>> convert_to_excel_data([((0, 0), (1, 2)), ((1, 2), (3, 3)), ((3, 3), (4, 5))])
+        >>> convert_to_excel_data([(0, 0, 1, 2), (1, 2, 3, 3), (3, 3, 4, 5)])
         ([0, 1, 3, 4], [0, 2, 3, 5])
-        >>> convert_to_excel_data([((0, 0), (1, 2)), ((1, 0), (2, 2))])
+        >>> convert_to_excel_data([(0, 0, 1, 2), (1, 0, 2, 2)])
         ([0, 1, 1, 2], [0, 2, 0, 2])
     """
-    lines = sorted(lines_, key=lambda line: line[0][0])
-    x_list = []
-    y_list = []
-
-    for i in range(len(lines)):
-        x_list.append(lines[i][0][0])
-        y_list.append(lines[i][0][1])
-
-        if i != len(lines) - 1 and lines[i][1] == lines[i + 1][0]:
-            continue
-        x_list.append(lines[i][1][0])
-        y_list.append(lines[i][1][1])
+    lines = sorted(lines_, key=itemgetter(0))
+    x_list: list[float] = []
+    y_list: list[float] = []
+
+    # スライスによるタプル生成を避け、終点と次の始点を要素ごとに比較する。
+    for line, next_line in zip(lines, lines[1:]):
+        x_list.append(line[0])
+        y_list.append(line[1])
+
+        if line[2] != next_line[0] or line[3] != next_line[1]:
+            x_list.append(line[2])
+            y_list.append(line[3])
+
+    if lines:
+        last_line = lines[-1]
+        x_list.append(last_line[0])
+        y_list.append(last_line[1])
+        x_list.append(last_line[2])
+        y_list.append(last_line[3])
 
     return x_list, y_list
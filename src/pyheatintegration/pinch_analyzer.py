@@ -4,9 +4,9 @@ from copy import deepcopy
 from .errors import InvalidMinimumApproachTempDiffError, PyHeatIntegrationError
 from .grand_composite_curve import GrandCompositeCurve
 from .heat_exchanger import HeatExchanger
-from .heat_range import HeatRange, get_merged_heat_ranges
+from .heat_range import get_merged_heat_ranges
 from .line import Line
-from .plot_segment import PlotSegment, get_plot_segments
+from .plot_segment import get_plot_segments_fused
 from .streams import Stream
 from .tq_diagram import TQDiagram, get_possible_minimum_temp_diff_range
 
@@ -110,17 +110,33 @@ class PinchAnalyzer:
                 [plot_segment.heat_range for plot_segment in self.tq.ccc_merged]
             ]
         )
-        hot_heat_range_plot_segment: dict[HeatRange, PlotSegment] = {
-            s.heat_range: s for s in get_plot_segments(all_heat_ranges, self.tq.hcc_merged)
-        }
-        cold_heat_range_plot_segment: dict[HeatRange, PlotSegment] = {
-            s.heat_range: s for s in get_plot_segments(all_heat_ranges, self.tq.ccc_merged)
-        }
+        # get_plot_segments_fusedの結果はall_heat_rangesの部分列と熱量領域が一致した昇順の
+        # リストとなるため、辞書を構築せずに添字を進めながら対応付けを行う。
+        aligned_hot_plot_segments = get_plot_segments_fused(
+            all_heat_ranges, self.tq.hcc_merged
+        )
+        aligned_cold_plot_segments = get_plot_segments_fused(
+            all_heat_ranges, self.tq.ccc_merged
+        )
 
         self.heat_exchangers: list[HeatExchanger] = []
+        hot_index = 0
+        cold_index = 0
         for heat_range in all_heat_ranges:
-            hot_plot_segment = hot_heat_range_plot_segment.get(heat_range, None)
-            cold_plot_segment = cold_heat_range_plot_segment.get(heat_range, None)
+            # 境界の熱量の差が許容誤差未満の場合、同じ熱量領域に複数のプロットセグメント
+            # が対応することがあるため、開始値が一致する間は読み進め、辞書を用いた場合と
+            # 同様に最後のものを採用する。
+            hot_plot_segment = None
+            while hot_index < len(aligned_hot_plot_segments) \
+                    and aligned_hot_plot_segments[hot_index].start_heat() == heat_range.start:
+                hot_plot_segment = aligned_hot_plot_segments[hot_index]
+                hot_index += 1
+
+            cold_plot_segment = None
+            while cold_index < len(aligned_cold_plot_segments) \
+                    and aligned_cold_plot_segments[cold_index].start_heat() == heat_range.start:
+                cold_plot_segment = aligned_cold_plot_segments[cold_index]
+                cold_index += 1
 
             if hot_plot_segment is None or cold_plot_segment is None:
                 continue
@@ -134,8 +150,15 @@ class PinchAnalyzer:
         streams: list[Stream],
         ignore_validation: bool = False
     ) -> str:
-        # idの重複を検証。必ず検証する必要あり。
+        # idの重複の検証と与熱・受熱流体の最高・最低温度の集計を1回の走査で行う。
+        # idの重複は必ず検証する必要あり。
         id_set: set[str] = set()
+        has_hot = False
+        has_cold = False
+        hot_maximum_temp = -math.inf
+        hot_minimum_temp = math.inf
+        cold_maximum_temp = -math.inf
+        cold_minimum_temp = math.inf
         for stream in streams:
             if stream.id_ in id_set:
                 return (
@@ -144,18 +167,27 @@ class PinchAnalyzer:
                 )
             id_set.add(stream.id_)
 
-        # 与熱流体と受熱流体が必ず一つ以上設定されていることを検証。必ず検証する必要がり。
-        hot_streams = [stream for stream in streams if stream.is_hot()]
-        cold_streams = [stream for stream in streams if stream.is_cold()]
+            if stream.is_hot():
+                has_hot = True
+                input_temp = stream.input_temperature()
+                output_temp = stream.output_temperature()
+                if input_temp > hot_maximum_temp:
+                    hot_maximum_temp = input_temp
+                if output_temp < hot_minimum_temp:
+                    hot_minimum_temp = output_temp
+            else:
+                has_cold = True
+                input_temp = stream.input_temperature()
+                output_temp = stream.output_temperature()
+                if output_temp > cold_maximum_temp:
+                    cold_maximum_temp = output_temp
+                if input_temp < cold_minimum_temp:
+                    cold_minimum_temp = input_temp
 
-        if not hot_streams or not cold_streams:
+        # 与熱流体と受熱流体が必ず一つ以上設定されていることを検証。必ず検証する必要がり。
+        if not has_hot or not has_cold:
             return '与熱流体および受熱流体は少なくとも1つは指定する必要があります。'
 
-        hot_maximum_temp = max(stream.input_temperature() for stream in hot_streams)
-        hot_minimum_temp = min(stream.output_temperature() for stream in hot_streams)
-        cold_maximum_temp = max(stream.output_temperature() for stream in cold_streams)
-        cold_minimum_temp = min(stream.input_temperature() for stream in cold_streams)
-
         # 与熱流体の最高温度 ≤ 受熱流体の最低温度は解析不可能。必ず検証する必要あり。
         if hot_maximum_temp <= cold_minimum_temp:
             return '与熱流体の最高温度が受熱流体の最低温度を下回っています。'
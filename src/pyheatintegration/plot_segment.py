@@ -6,6 +6,7 @@ from collections.abc import Iterable
 from typing import Optional
 
 from .base_range import is_continuous as is_continuous_ranges
+from .base_range import minmax
 from .enums import StreamState
 from .heat_range import HeatRange
 from .line import Line
@@ -15,6 +16,9 @@ from .temperature_range import TemperatureRange
 class PlotSegment:
     """プロットの一部を表すクラスです。
 
+    熱量と温度は開始値・終了値をfloatのまま保持し、`HeatRange`/`TemperatureRange`は
+    初めてアクセスされたときにのみ生成します。
+
     Args:
         start_heat (float): 熱量の開始値。
         finish_heat (float): 熱量の終了値。
@@ -32,6 +36,19 @@ class PlotSegment:
         reboiler_or_reactor (bool): 対応する流体がリボイラーもしくは反応器で用いられるか。
     """
 
+    __slots__ = (
+        '_start_heat',
+        '_finish_heat',
+        '_start_temperature',
+        '_finish_temperature',
+        '_heat_range',
+        '_temperature_range',
+        'uuid',
+        'state',
+        'reboiler_or_reactor',
+        'slope'
+    )
+
     def __init__(
         self,
         start_heat: float = 0.0,
@@ -42,8 +59,12 @@ class PlotSegment:
         state: StreamState = StreamState.UNKNOWN,
         reboiler_or_reactor: bool = False
     ):
-        self.heat_range = HeatRange(start_heat, finish_heat)
-        self.temperature_range = TemperatureRange(start_temperature, finish_temperature)
+        self._start_heat, self._finish_heat = minmax(start_heat, finish_heat)
+        self._start_temperature, self._finish_temperature = minmax(
+            start_temperature, finish_temperature
+        )
+        self._heat_range: Optional[HeatRange] = None
+        self._temperature_range: Optional[TemperatureRange] = None
         if uuid_ is None:
             self.uuid = str(uuid.uuid4())
         else:
@@ -52,61 +73,100 @@ class PlotSegment:
         self.state = state
         self.reboiler_or_reactor = reboiler_or_reactor
         try:
-            self.slope = self.temperature_range.delta / self.heat_range.delta
+            self.slope = (self._finish_temperature - self._start_temperature) \
+                / (self._finish_heat - self._start_heat)
         except ZeroDivisionError:
             self.slope = math.inf
 
+    def clone(self) -> PlotSegment:
+        """同じ値を持つプロットセグメントを返します。
+
+        deepcopyと異なり、memo辞書やリフレクションを経由せずにスロットの値を
+        直接コピーします。
+
+        Returns:
+            PlotSegment: 複製したプロットセグメント。
+        """
+        cloned = object.__new__(PlotSegment)
+        cloned._start_heat = self._start_heat
+        cloned._finish_heat = self._finish_heat
+        cloned._start_temperature = self._start_temperature
+        cloned._finish_temperature = self._finish_temperature
+        cloned._heat_range = None
+        cloned._temperature_range = None
+        cloned.uuid = self.uuid
+        cloned.state = self.state
+        cloned.reboiler_or_reactor = self.reboiler_or_reactor
+        cloned.slope = self.slope
+        return cloned
+
+    @property
+    def heat_range(self) -> HeatRange:
+        if self._heat_range is None:
+            self._heat_range = HeatRange(self._start_heat, self._finish_heat)
+        return self._heat_range
+
+    @property
+    def temperature_range(self) -> TemperatureRange:
+        if self._temperature_range is None:
+            self._temperature_range = TemperatureRange(
+                self._start_temperature, self._finish_temperature
+            )
+        return self._temperature_range
+
     def __str__(self) -> str:
         return (
-            f"heat: ({self.heat_range.start}; "
-            f"{self.heat_range.finish}) "
-            f"temperature: ({self.temperature_range.start}; "
-            f"{self.temperature_range.finish})"
+            f"heat: ({self._start_heat}; "
+            f"{self._finish_heat}) "
+            f"temperature: ({self._start_temperature}; "
+            f"{self._finish_temperature})"
         )
 
     def __repr__(self) -> str:
         return (
             f"PlotSegment("
-            f"{self.heat_range.start}, "
-            f"{self.heat_range.finish}, "
-            f"{self.temperature_range.start}, "
-            f"{self.temperature_range.finish})"
+            f"{self._start_heat}, "
+            f"{self._finish_heat}, "
+            f"{self._start_temperature}, "
+            f"{self._finish_temperature})"
         )
 
     def __format__(self, format_spec: str) -> str:
         return (
             f"PlotSegment("
-            f"{self.heat_range.start.__format__(format_spec)}, "
-            f"{self.heat_range.finish.__format__(format_spec)}, "
-            f"{self.temperature_range.start}, "
-            f"{self.temperature_range.finish})"
+            f"{self._start_heat.__format__(format_spec)}, "
+            f"{self._finish_heat.__format__(format_spec)}, "
+            f"{self._start_temperature}, "
+            f"{self._finish_temperature})"
         )
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, PlotSegment):
             return NotImplemented
-        return self.heat_range == other.heat_range \
-            and self.temperature_range == other.temperature_range
+        return self._start_heat == other._start_heat \
+            and self._finish_heat == other._finish_heat \
+            and self._start_temperature == other._start_temperature \
+            and self._finish_temperature == other._finish_temperature
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, PlotSegment):
             return NotImplemented
-        return self.heat_range < other.heat_range
+        return self._start_heat < other._start_heat
 
     def __le__(self, other: object) -> bool:
         if not isinstance(other, PlotSegment):
             return NotImplemented
-        return self.heat_range <= other.heat_range
+        return self._start_heat <= other._start_heat
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, PlotSegment):
             return NotImplemented
-        return self.heat_range > other.heat_range
+        return self._start_heat > other._start_heat
 
     def __ge__(self, other: object) -> bool:
         if not isinstance(other, PlotSegment):
             return NotImplemented
-        return self.heat_range >= other.heat_range
+        return self._start_heat >= other._start_heat
 
     def line(self) -> Line:
         """直線の始点と終点を返します。
@@ -114,10 +174,9 @@ class PlotSegment:
         Returns:
             Line: 直線。
         """
-        return (
-            (self.heats()[0], self.temperatures()[0]),
-            (self.heats()[1], self.temperatures()[1])
-        )
+        heat_start, heat_finish = self.heats()
+        temp_start, temp_finish = self.temperatures()
+        return (heat_start, temp_start, heat_finish, temp_finish)
 
     def heats(self) -> tuple[float, float]:
         """熱量の開始値と終了値を返します。
@@ -125,7 +184,7 @@ class PlotSegment:
         Returns:
             tuple[float, float]: 熱量の開始値と終了値。
         """
-        return self.heat_range()
+        return self._start_heat, self._finish_heat
 
     def start_heat(self) -> float:
         """熱量の開始値を返します。
@@ -133,7 +192,7 @@ class PlotSegment:
         Returns:
             float: 熱量の開始値。
         """
-        return self.heat_range.start
+        return self._start_heat
 
     def finish_heat(self) -> float:
         """熱量の終了値を返します。
@@ -141,7 +200,7 @@ class PlotSegment:
         Returns:
             float: 熱量の終了値。
         """
-        return self.heat_range.finish
+        return self._finish_heat
 
     def temperatures(self) -> tuple[float, float]:
         """温度の開始値と終了値を返します。
@@ -149,7 +208,7 @@ class PlotSegment:
         Returns:
             tuple[float, float]: 温度の開始値と終了値。
         """
-        return self.temperature_range()
+        return self._start_temperature, self._finish_temperature
 
     def start_temperature(self) -> float:
         """温度の開始値を返します。
@@ -157,7 +216,7 @@ class PlotSegment:
         Returns:
             float: 温度の開始値。
         """
-        return self.temperature_range.start
+        return self._start_temperature
 
     def finish_temperature(self) -> float:
         """温度の終了値を返します。
@@ -165,18 +224,19 @@ class PlotSegment:
         Returns:
             float: 温度の終了値。
         """
-        return self.temperature_range.finish
+        return self._finish_temperature
 
-    def contain_heat(self, heat: float) -> bool:
+    def contain_heat(self, heat: float, eps: float = 1e-6) -> bool:
         """熱量を含むかを返します。
 
         Args:
             heat (float): 含むかを検証する熱量。
+            eps (float): 許容誤差。
 
         Returns:
             bool: 熱量を含むかどうか。
         """
-        return heat in self.heat_range
+        return self._start_heat - eps <= heat <= self._finish_heat + eps
 
     def contain_heats(self, heats: Iterable[float]) -> bool:
         """複数の熱量を含むかを返します。
@@ -198,7 +258,7 @@ class PlotSegment:
         Returns:
             bool: 温度を含むかどうか。
         """
-        return temperature in self.temperature_range
+        return self._start_temperature <= temperature <= self._finish_temperature
 
     def temperatures_at_heats(self, heats: tuple[float, float]) -> tuple[float, float]:
         """ある複数の熱量をとる温度を返します。
@@ -223,9 +283,7 @@ class PlotSegment:
         if not self.contain_heat(heat):
             raise ValueError('heatを含んでいる必要があります。')
 
-        heat_left, _ = self.heat_range()
-        temp_left, _ = self.temperature_range()
-        return self.slope * (heat - heat_left) + temp_left
+        return self.slope * (heat - self._start_heat) + self._start_temperature
 
     def heat_at_temperature(self, temperature: float) -> float:
         """ある温度をとる熱量を返します。
@@ -239,9 +297,8 @@ class PlotSegment:
         if not self.contain_temperature(temperature):
             raise ValueError('temperatureを含んでいる必要があります。')
 
-        heat_left, _ = self.heat_range()
-        temp_left, _ = self.temperature_range()
-        return 1 / self.slope * (temperature - temp_left) + heat_left
+        return 1 / self.slope * (temperature - self._start_temperature) \
+            + self._start_heat
 
     def shift_heat(self, delta: float) -> None:
         """熱量をずらします。
@@ -249,9 +306,12 @@ class PlotSegment:
         Args:
             delta (float): ずらす値。
         """
-        self.heat_range.shift(delta)
+        self._start_heat += delta
+        self._finish_heat += delta
+        self._heat_range = None
         try:
-            self.slope = self.temperature_range.delta / self.heat_range.delta
+            self.slope = (self._finish_temperature - self._start_temperature) \
+                / (self._finish_heat - self._start_heat)
         except ZeroDivisionError:
             self.slope = math.inf
 
@@ -345,6 +405,73 @@ def get_plot_segments(
     return res
 
 
+def get_plot_segments_fused(
+    heat_ranges: list[HeatRange],
+    plot_segments: list[PlotSegment],
+    eps: float = 1e-6
+) -> list[PlotSegment]:
+    """指定された熱量領域のプロットセグメントを返します。
+
+    get_plot_segmentsと同じ結果を返しますが、熱量領域とプロットセグメントがともに熱量に
+    関して昇順に並んでいることを利用し、包含判定・温度の補間・プロットセグメントの生成を一度
+    の走査で行います。
+
+    Args:
+        heat_ranges (list[HeatRange]): 熱量領域のリスト(昇順)。
+        plot_segments (list[PlotSegment]): プロットセグメントのリスト(昇順)。
+        eps (float): 熱量の包含判定に用いる許容誤差。
+
+    Returns:
+        list[PlotSegment]: プロットセグメントのリスト。
+    """
+    segments = [
+        (
+            plot_segment.start_heat(),
+            plot_segment.finish_heat(),
+            plot_segment.start_temperature(),
+            plot_segment.slope,
+            plot_segment.uuid,
+            plot_segment.state,
+            plot_segment.reboiler_or_reactor
+        ) for plot_segment in plot_segments
+    ]
+
+    res: list[PlotSegment] = []
+    index = 0
+    for heat_range in heat_ranges:
+        start_heat, finish_heat = heat_range()
+
+        # 現在の熱量領域より手前で終わるプロットセグメントは以降の熱量領域にも
+        # 対応しないため、読み飛ばします。
+        while index < len(segments) and segments[index][1] < start_heat - eps:
+            index += 1
+
+        for i in range(index, len(segments)):
+            heat_left, heat_right, temp_left, slope, uuid_, state, reboiler_or_reactor = segments[i]
+            if heat_left - eps > start_heat:
+                break
+            if finish_heat > heat_right + eps:
+                continue
+            if math.isinf(slope):
+                start_temperature = temp_left
+                finish_temperature = temp_left
+            else:
+                start_temperature = slope * (start_heat - heat_left) + temp_left
+                finish_temperature = slope * (finish_heat - heat_left) + temp_left
+            res.append(
+                PlotSegment(
+                    start_heat,
+                    finish_heat,
+                    start_temperature,
+                    finish_temperature,
+                    uuid_,
+                    state,
+                    reboiler_or_reactor
+                )
+            )
+    return res
+
+
 def is_continuous(
     plot_segments: list[PlotSegment]
 ) -> Optional[tuple[float, float]]:
@@ -5,7 +5,7 @@ from typing import Optional, cast
 from .heat_range import (REL_TOL_DIGIT, HeatRange, flatten_heat_ranges,
                          get_heat_ranges)
 from .line import Line
-from .plot_segment import PlotSegment, get_plot_segments, temp_diff
+from .plot_segment import PlotSegment, get_plot_segments_fused, temp_diff
 from .streams import Stream
 from .temperature_range import TemperatureRange
 
@@ -77,11 +77,11 @@ class Segment:
         # 与熱流体と受熱流体を合わせた熱量変化帯を得る。
         self.heat_ranges = get_heat_ranges(sorted(list(set(hot_heats + cold_heats))))
 
-        self.hot_plot_segments_separated = get_plot_segments(
+        self.hot_plot_segments_separated = get_plot_segments_fused(
             self.heat_ranges,
             self.hot_plot_segments_separated_streams
         )
-        self.cold_plot_segments_separated = get_plot_segments(
+        self.cold_plot_segments_separated = get_plot_segments_fused(
             self.heat_ranges,
             self.cold_plot_segments_separated_streams
         )
@@ -1,2 +1,24 @@
 from .streams import *  # noqa
-from .utilities import *  # noqa
+
+from . import utilities as _utilities
+
+# ワイルドカードインポートはモジュールレベルの__getattr__を参照しないため、
+# utilitiesの流体も__all__に含めて公開します。__all__に含まれる名前は
+# __getattr__経由で解決されるため、遅延生成は維持されます。
+__all__ = [
+    'Stream',
+    'get_temperature_range_streams',
+    'get_temperature_range_heats',
+    'get_temperature_range_lacking_heats',
+] + _utilities.__all__
+
+
+def __getattr__(name: str):
+    # utilitiesの流体は遅延生成されるため、属性アクセス時に転送します。
+    if name in _utilities.__all__:
+        return getattr(_utilities, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_utilities.__all__))
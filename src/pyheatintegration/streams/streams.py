@@ -1,14 +1,32 @@
+from __future__ import annotations
+
 import math
 import uuid
 from collections import defaultdict
+from bisect import bisect_left, bisect_right
 from collections.abc import Iterable
-from copy import copy
+from typing import Optional
 
 from ..enums import StreamState, StreamType
 from ..errors import InvalidStreamError
 from ..temperature_range import (TemperatureRange, get_temperature_ranges,
                                  get_temperature_transition)
 
+# 流体の種類をビットフラグに変換しておき、与熱・外部流体の判定を整数演算で行う。
+# 公開APIはEnumのままとする。
+_HOT_BIT = 0b01
+_EXTERNAL_BIT = 0b10
+_TYPE_BITS: dict[StreamType, int] = {
+    StreamType.COLD: 0,
+    StreamType.HOT: _HOT_BIT,
+    StreamType.EXTERNAL_COLD: _EXTERNAL_BIT,
+    StreamType.EXTERNAL_HOT: _HOT_BIT | _EXTERNAL_BIT,
+    StreamType.AUTO: 0,
+}
+_PHASE_CHANGE_STATES = frozenset({
+    StreamState.LIQUID_EVAPORATION, StreamState.GAS_CONDENSATION
+})
+
 
 class Stream:
     r"""熱交換を行う流体を表すクラス。
@@ -49,6 +67,21 @@ class Stream:
         InvalidStreamError: 入り口温度と出口温度が同じ流体の種類は明示的に指定する必要があります。
     """
 
+    __slots__ = (
+        '_id',
+        'type_',
+        'cost',
+        'temperature_range',
+        'heat_load',
+        'state',
+        'reboiler_or_reactor',
+        '_is_hot',
+        '_is_external',
+        '_is_isothermal',
+        '_hash',
+        '_heat_per_delta'
+    )
+
     def __init__(
         self,
         input_temperature: float,
@@ -60,12 +93,12 @@ class Stream:
         reboiler_or_reactor: bool = False,
         id_: str = ''
     ):
-        if id_:
-            self.id_ = id_
-        else:
-            self.id_ = str(uuid.uuid4())
+        # uuidの生成はos.urandomの呼び出しを伴うため、idが実際に参照されるまで遅延する。
+        self._id: Optional[str] = id_ or None
+        self._hash: Optional[int] = None
 
-        if type_ == StreamType.AUTO:
+        # Enumのメンバーは単一のインスタンスであるため、比較は同一性で行う。
+        if type_ is StreamType.AUTO:
             if input_temperature < output_temperature:
                 self.type_ = StreamType.COLD
             elif input_temperature > output_temperature:
@@ -77,19 +110,25 @@ class Stream:
         else:
             self.type_ = type_
 
-        if self.is_internal() and heat_load == 0:
+        # 検証は正常系でメソッド呼び出しを伴わないよう、ローカル変数のフラグと数値の
+        # 比較のみで分岐し、例外オブジェクトの生成は失敗時に限る。
+        type_bits = _TYPE_BITS[self.type_]
+        is_hot = self._is_hot = bool(type_bits & _HOT_BIT)
+        is_external = self._is_external = bool(type_bits & _EXTERNAL_BIT)
+
+        if not is_external and heat_load == 0:
             raise InvalidStreamError(
                 "外部流体でない流体の熱量の入力値は0でない必要があります。"
                 f"流体の種類: {self.type_.describe()} 熱量: {heat_load}"
             )
 
-        if self.is_external() and heat_load != 0:
+        if is_external and heat_load != 0:
             raise InvalidStreamError(
                 "外部流体の熱量の入力値は0である必要があります。"
                 f"流体の種類: {self.type_.describe()} 熱量: {heat_load}"
             )
 
-        if self.is_cold() and input_temperature > output_temperature:
+        if not is_hot and input_temperature > output_temperature:
             raise InvalidStreamError(
                 "受熱流体は入り口温度が出口温度より低い必要があります。"
                 f"流体の種類: {self.type_.describe()} "
@@ -97,7 +136,7 @@ class Stream:
                 f"出口温度 [℃]: {output_temperature}"
             )
 
-        if self.is_hot() and input_temperature < output_temperature:
+        if is_hot and input_temperature < output_temperature:
             raise InvalidStreamError(
                 "与熱流体は入り口温度が出口温度より高い必要があります。"
                 f"流体の種類: {self.type_.describe()} "
@@ -105,7 +144,7 @@ class Stream:
                 f"出口温度 [℃]: {output_temperature}"
             )
 
-        if self.is_internal() and cost != 0:
+        if not is_external and cost != 0:
             raise InvalidStreamError(
                 "外部流体以外にはコストを設定できません。"
                 f"流体の種類: {self.type_.describe()} "
@@ -117,12 +156,14 @@ class Stream:
             input_temperature,
             output_temperature
         )
+        self._is_isothermal = math.isclose(self.temperature_range.delta, 0.0)
         self.heat_load = heat_load
+        # 温度変化あたりの熱量は初回参照時に計算し、温度・熱量が更新されるまで使い回す。
+        self._heat_per_delta: Optional[float] = None
 
         self.state = state
 
-        if self.state in [StreamState.LIQUID_EVAPORATION, StreamState.GAS_CONDENSATION] \
-           and not self.is_isothermal():
+        if self.state in _PHASE_CHANGE_STATES and not self._is_isothermal:
             raise InvalidStreamError(
                 '相変化によって熱交換を行う流体は等温である必要があります。'
                 f'流体の状態: {self.state.describe()} '
@@ -132,6 +173,13 @@ class Stream:
 
         self.reboiler_or_reactor = reboiler_or_reactor
 
+    @property
+    def id_(self) -> str:
+        """流体を区別する識別子。指定されなかった場合は初回参照時にuuidを生成します。"""
+        if self._id is None:
+            self._id = str(uuid.uuid4())
+        return self._id
+
     def __repr__(self) -> str:
         return (
             f'Stream('
@@ -154,6 +202,17 @@ class Stream:
             f'heat flow [W]: {self.heat_load}'
         )
 
+    def __eq__(self, other: object) -> bool:
+        """idが等しい場合に等しい流体とみなします。"""
+        if not isinstance(other, Stream):
+            return NotImplemented
+        return self.id_ == other.id_
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.id_)
+        return self._hash
+
     def __format__(self, format_spec: str) -> str:
         description = self.type_.describe()
         return (
@@ -163,6 +222,50 @@ class Stream:
             f'heat flow [W]: {self.heat_load.__format__(format_spec)}'
         )
 
+    @classmethod
+    def _fast_subrange(
+        cls,
+        template: Stream,
+        start: float,
+        finish: float,
+        heat_per_delta: Optional[float] = None
+    ) -> Stream:
+        """温度領域を絞った流体を検証やcopyを経ずに生成します。
+
+        入力が正しいことが分かっている内部のホットパス専用です。熱量は元々の温度変化と
+        新たな温度変化の比に従って更新します。等温流体には使用できません。
+
+        Args:
+            template (Stream): 元となる流体。
+            start (float): 新たな入り口温度 [℃]。
+            finish (float): 新たな出口温度 [℃]。
+            heat_per_delta (Optional[float]):
+                事前に計算した温度変化あたりの熱量。同じ流体から多数の温度領域を
+                生成する際に除算を繰り返さないために指定します。
+
+        Returns:
+            Stream: 温度領域を絞った流体。
+        """
+        if heat_per_delta is None:
+            heat_per_delta = template.heat_per_delta()
+
+        stream = object.__new__(cls)
+        stream._id = template.id_
+        # idを共有するためハッシュ値も共有できる。
+        stream._hash = template._hash
+        stream.type_ = template.type_
+        stream.cost = template.cost
+        stream.state = template.state
+        stream.reboiler_or_reactor = template.reboiler_or_reactor
+        stream._is_hot = template._is_hot
+        stream._is_external = template._is_external
+        stream._is_isothermal = False
+        stream.temperature_range = TemperatureRange(start, finish)
+        stream.heat_load = heat_per_delta * (finish - start)
+        # 温度領域を絞っても温度変化あたりの熱量は変わらない。
+        stream._heat_per_delta = heat_per_delta
+        return stream
+
     def sort_key(self) -> float:
         """ソートの際に用いるキーを返します。
 
@@ -181,7 +284,7 @@ class Stream:
         Returns:
             bool: 外部流体であるかどうか。
         """
-        return self.type_ in [StreamType.EXTERNAL_HOT, StreamType.EXTERNAL_COLD]
+        return self._is_external
 
     def is_internal(self) -> bool:
         """外部流体以外であるかを返します。
@@ -197,7 +300,7 @@ class Stream:
         Returns:
             bool: 与熱流体であるかどうか。
         """
-        return self.type_ in [StreamType.HOT, StreamType.EXTERNAL_HOT]
+        return self._is_hot
 
     def is_cold(self) -> bool:
         """受熱流体であるかを返します。
@@ -213,7 +316,7 @@ class Stream:
         Returns:
             bool: 等温流体であるかどうか。
         """
-        return math.isclose(self.temperature_range.delta, 0.0)
+        return self._is_isothermal
 
     def input_temperature(self) -> float:
         """入り口温度を返します。
@@ -251,6 +354,19 @@ class Stream:
         """
         return self.heat_load
 
+    def heat_per_delta(self) -> float:
+        """温度変化あたりの熱量を返します。
+
+        初回呼び出し時に計算した値をキャッシュし、温度・熱量が更新されるまで使い回し
+        ます。等温流体に対しては呼び出せません。
+
+        Returns:
+            float: 温度変化あたりの熱量 [W/℃]。
+        """
+        if self._heat_per_delta is None:
+            self._heat_per_delta = self.heat_load / self.temperature_range.delta
+        return self._heat_per_delta
+
     def temperatures(self) -> tuple[float, float]:
         """入り口温度と出口温度を返します。
 
@@ -289,7 +405,9 @@ class Stream:
         Returns:
             bool: 与えられた複数の温度をとるかどうか。
         """
-        return all(map(lambda t: t in self.temperature_range, temperatures))
+        temperature_range = self.temperature_range
+        start, finish = temperature_range.start, temperature_range.finish
+        return all(start <= t <= finish for t in temperatures)
 
     def update_temperature(
         self,
@@ -313,8 +431,10 @@ class Stream:
 
         old_temp_delta = self.temperature_range.delta
         self.temperature_range = TemperatureRange(input_temperature, output_temperature)
+        self._is_isothermal = math.isclose(self.temperature_range.delta, 0.0)
 
         self.heat_load = self.heat() * self.temperature_range.delta / old_temp_delta
+        self._heat_per_delta = None
 
     def update_heat(self, heat_load: float) -> None:
         """熱量を更新します。
@@ -331,6 +451,70 @@ class Stream:
             raise ValueError("非等温流体は入り口温度・出口温度を変更せずに熱量を変更できません。")
 
         self.heat_load = heat_load
+        self._heat_per_delta = None
+
+
+class _StreamSegmentTree:
+    """温度領域を葉とするセグメント木。
+
+    各流体を、その温度範囲が完全に覆うO(log N)個の正準ノードに登録し、各温度領域に属する
+    流体の集合を根から葉への経路上の集合の和として取り出すための内部クラスです。流体ごとに
+    対応する葉の範囲を二分探索で求めるため、構築は流体のリストの一度の走査で済みます。
+    """
+
+    __slots__ = ('size', 'canonical')
+
+    def __init__(self, temp_ranges: list[TemperatureRange], streams: Iterable[Stream]):
+        self.size = len(temp_ranges)
+        self.canonical: list[set[Stream]] = [set() for _ in range(2 * self.size)]
+
+        starts = [temp_range.start for temp_range in temp_ranges]
+        finishes = [temp_range.finish for temp_range in temp_ranges]
+        for stream in streams:
+            temperature_range = stream.temperature_range
+            lo = bisect_left(starts, temperature_range.start)
+            hi = bisect_right(finishes, temperature_range.finish)
+            if lo < hi:
+                self._insert(stream, lo, hi)
+
+    def _insert(self, stream: Stream, lo: int, hi: int) -> None:
+        left = lo + self.size
+        right = hi + self.size
+        while left < right:
+            if left & 1:
+                self.canonical[left].add(stream)
+                left += 1
+            if right & 1:
+                right -= 1
+                self.canonical[right].add(stream)
+            left >>= 1
+            right >>= 1
+
+    def at(self, index: int) -> set[Stream]:
+        """指定したインデックスの温度領域に属する流体の集合を返します。
+
+        Args:
+            index (int): 温度領域のインデックス。
+
+        Returns:
+            set[Stream]: 温度領域に属する流体の集合。
+        """
+        path = []
+        node = index + self.size
+        while node >= 1:
+            if self.canonical[node]:
+                path.append(self.canonical[node])
+            node >>= 1
+
+        if not path:
+            return set()
+
+        # 最大の集合をコピーして小さい集合を加えることで、ハッシュ計算の回数を抑えます。
+        path.sort(key=len, reverse=True)
+        res = set(path[0])
+        for streams in path[1:]:
+            res |= streams
+        return res
 
 
 def get_temperature_range_streams(
@@ -348,49 +532,119 @@ def get_temperature_range_streams(
             list[list[TemperatureRange], defaultdict[TemperatureRange, set[Stream]]:
                 温度領域、温度領域に属する流体。
     """
-    temperatures = sorted(get_temperature_transition([
+    temperatures = get_temperature_transition([
         stream.temperature_range for stream in streams
-    ]))
-    temp_ranges = sorted(get_temperature_ranges(temperatures))
+    ])
+    # 温度は昇順で返され、得られる温度領域も開始値に関して昇順となる。
+    temp_ranges = get_temperature_ranges(temperatures)
 
-    temp_streams: defaultdict[float, set[Stream]] = defaultdict(set)
-    for temperature in temperatures:
-        for stream in streams:
-            if stream.contain_temperature(temperature):
-                temp_streams[temperature].add(stream)
+    tree = _StreamSegmentTree(temp_ranges, streams)
 
     temp_range_streams: defaultdict[TemperatureRange, set[Stream]] = defaultdict(set)
-    for temp_range in temp_ranges:
-        target_streams = temp_streams[temp_range.start] & temp_streams[temp_range.finish]
-
+    for i, temp_range in enumerate(temp_ranges):
         # 温度変化が0の領域の場合、温度変化がある流体を除く
         if temp_range.delta == 0:
-            target_streams -= set(stream for stream in target_streams if not stream.is_isothermal())
+            target_streams = {
+                stream for stream in tree.at(i) if stream.is_isothermal()
+            }
+        else:
+            target_streams = tree.at(i)
 
         for target_stream in target_streams:
-            stream = copy(target_stream)
-            if not stream.is_isothermal():
-                stream.update_temperature(temp_range.start, temp_range.finish)
-            temp_range_streams[temp_range].add(stream)
+            if target_stream.is_isothermal():
+                # 等温流体はこの関数内で変更されないため、そのまま登録します。
+                temp_range_streams[temp_range].add(target_stream)
+            else:
+                temp_range_streams[temp_range].add(Stream._fast_subrange(
+                    target_stream,
+                    temp_range.start,
+                    temp_range.finish,
+                    target_stream.heat_per_delta()
+                ))
 
     return temp_ranges, temp_range_streams
 
 
 def get_temperature_range_heats(
     streams: list[Stream]
-) -> tuple[list[TemperatureRange], dict[TemperatureRange, float]]:
+) -> tuple[list[TemperatureRange], list[float]]:
     """温度領域ごとに必要な熱量を返します。
 
+    温度領域と熱量は添字で対応する二つのリストとして返します。辞書を構築しないため、
+    呼び出し側はそのまま累積するだけで済みます。
+
+    Args:
+        streams (list[Stream]): 流体のリスト。
+
+    Returns:
+        tuple[list[TemperatureRange], list[float]]:
+            温度領域(昇順)、温度領域ごとの必要熱量。
+    """
+    temperatures = get_temperature_transition([
+        stream.temperature_range for stream in streams
+    ])
+    # 温度は昇順で返され、得られる温度領域も開始値に関して昇順となる。
+    temp_ranges = get_temperature_ranges(temperatures)
+
+    # 流体ごとに対応する温度領域を二分探索で求め、熱量を直接集計する。温度領域ごとの
+    # 流体の集合を構築する必要はない。
+    starts = [temp_range.start for temp_range in temp_ranges]
+    finishes = [temp_range.finish for temp_range in temp_ranges]
+    totals = [0.0] * len(temp_ranges)
+    for stream in streams:
+        temperature_range = stream.temperature_range
+        lo = bisect_left(starts, temperature_range.start)
+        hi = bisect_right(finishes, temperature_range.finish)
+        if stream.is_isothermal():
+            # 等温流体は対応する温度変化0の領域に全熱量を与える。
+            for i in range(lo, hi):
+                totals[i] += stream.heat_load
+        else:
+            heat_per_delta = stream.heat_per_delta()
+            for i in range(lo, hi):
+                totals[i] += heat_per_delta * temp_ranges[i].delta
+
+    return temp_ranges, totals
+
+
+def get_temperature_range_lacking_heats(
+    streams: list[Stream]
+) -> tuple[list[TemperatureRange], list[float]]:
+    """温度領域ごとの不足熱量(与熱量と受熱量の差)を返します。
+
+    グランドコンポジットカーブの構築に必要な値を、温度領域ごとの流体の集合を構築せずに
+    直接集計します。与熱流体の熱量を正、受熱流体の熱量を負として合計します。
+
     Args:
         streams (list[Stream]): 流体のリスト。
 
     Returns:
-        tuple[list[TemperatureRange], dict[TemperatureRange, float]]:
-            温度領域、温度領域ごとの必要熱量。
+        tuple[list[TemperatureRange], list[float]]:
+            温度領域(昇順)、温度領域ごとの不足熱量。
     """
-    temp_ranges, temp_range_streams = get_temperature_range_streams(streams)
-    tem_range_heats = {
-        temp_range: sum(stream.heat() for stream in temp_range_streams[temp_range])
-        for temp_range in temp_ranges
-    }
-    return temp_ranges, tem_range_heats
+    temperatures = get_temperature_transition([
+        stream.temperature_range for stream in streams
+    ])
+    # 温度は昇順で返され、得られる温度領域も開始値に関して昇順となる。
+    temp_ranges = get_temperature_ranges(temperatures)
+
+    starts = [temp_range.start for temp_range in temp_ranges]
+    finishes = [temp_range.finish for temp_range in temp_ranges]
+    totals = [0.0] * len(temp_ranges)
+    for stream in streams:
+        temperature_range = stream.temperature_range
+        lo = bisect_left(starts, temperature_range.start)
+        hi = bisect_right(finishes, temperature_range.finish)
+        heat_load = stream.heat_load if stream._is_hot else -stream.heat_load
+        if stream.is_isothermal():
+            # 等温流体は対応する温度変化0の領域に全熱量を与える。
+            for i in range(lo, hi):
+                totals[i] += heat_load
+        else:
+            heat_per_delta = stream.heat_per_delta()
+            if not stream._is_hot:
+                heat_per_delta = -heat_per_delta
+            for i in range(lo, hi):
+                totals[i] += heat_per_delta * temp_ranges[i].delta
+
+    return temp_ranges, totals
@@ -2,15 +2,32 @@ from .streams import Stream, StreamState, StreamType
 
 # Some streams are provided as default on process design contest.
 # See http://scejcontest.chem-eng.kyushu-u.ac.jp/2021/download/processsim2021_v2.pdf.
+# Streams are created lazily on first attribute access (PEP 562) so that
+# importing this module costs nothing when they are not used.
 
-# Hot streams.
-HPStream = Stream(254, 254, 0, StreamType.EXTERNAL_HOT, StreamState.GAS_CONDENSATION, id_="HPStream")
-MPStream = Stream(186, 186, 0, StreamType.EXTERNAL_HOT, StreamState.GAS_CONDENSATION, id_="MPStream")
-LPStream = Stream(160, 160, 0, StreamType.EXTERNAL_HOT, StreamState.GAS_CONDENSATION, id_="LPStream")
+_FACTORIES = {
+    # Hot streams.
+    "HPStream": lambda: Stream(254, 254, 0, StreamType.EXTERNAL_HOT, StreamState.GAS_CONDENSATION, id_="HPStream"),
+    "MPStream": lambda: Stream(186, 186, 0, StreamType.EXTERNAL_HOT, StreamState.GAS_CONDENSATION, id_="MPStream"),
+    "LPStream": lambda: Stream(160, 160, 0, StreamType.EXTERNAL_HOT, StreamState.GAS_CONDENSATION, id_="LPStream"),
 
-# Cold streams.
-RefrigerantWater = Stream(30, 40, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID, id_="RefrigerantWater")
-RefrigerantMinus33 = Stream(-33, -33, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="RefrigerantMinus33")
-RefrigerantMinus18 = Stream(-18, -18, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="RefrigerantMinus18")
-Refrigerant0 = Stream(0, 0, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="Refrigerant0")
-Refrigerant18 = Stream(21, 21, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="Refrigerant18")
+    # Cold streams.
+    "RefrigerantWater": lambda: Stream(30, 40, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID, id_="RefrigerantWater"),
+    "RefrigerantMinus33": lambda: Stream(-33, -33, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="RefrigerantMinus33"),
+    "RefrigerantMinus18": lambda: Stream(-18, -18, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="RefrigerantMinus18"),
+    "Refrigerant0": lambda: Stream(0, 0, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="Refrigerant0"),
+    "Refrigerant18": lambda: Stream(21, 21, 0, StreamType.EXTERNAL_COLD, StreamState.LIQUID_EVAPORATION, id_="Refrigerant18"),
+}
+
+__all__ = list(_FACTORIES)
+
+_cache: dict[str, Stream] = {}
+
+
+def __getattr__(name: str) -> Stream:
+    if name in _FACTORIES:
+        stream = _cache.get(name)
+        if stream is None:
+            stream = _cache[name] = _FACTORIES[name]()
+        return stream
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+from array import array
+from collections import Counter
+from itertools import accumulate
+
 from .base_range import BaseRange, flatten, get_ranges, merge
 
 
 class TemperatureRange(BaseRange):
     """温度範囲を表すクラス。"""
 
+    __slots__ = ()
+
 
 BaseRange.register(TemperatureRange)
 
@@ -34,7 +40,7 @@ def get_temperature_transition(
         temperature_ranges (list[TemperatureRange]): 温度領域のリスト。
 
     Returns:
-        list[float]: 温度の推移。
+        list[float]: 温度の推移(昇順)。
 
     Examples:
         >>> temperature_ranges = [
@@ -48,57 +54,64 @@ def get_temperature_transition(
         >>> sorted(get_temperature_transition(temperature_ranges))
         [0, 10, 20, 30, 30, 40, 50, 70, 70]
     """
-    temperatures_set: set[float] = set()
+    # 温度ごとの多重度を辞書で管理し、最後に一度だけ平坦化する。
+    temp_counts: Counter[float] = Counter()
 
     for temperature_range in temperature_ranges:
         if temperature_range.delta == 0:
             continue
-        temperatures_set |= set(temperature_range())
-
-    temperatures = list(temperatures_set)
+        temp_counts[temperature_range.start] = 1
+        temp_counts[temperature_range.finish] = 1
 
     for temperature_range in temperature_ranges:
         if temperature_range.delta != 0:
             continue
         temp = temperature_range.start
-        temp_count = temperatures.count(temp)
-        if temp_count == 0:
-            temperatures.extend([temp, temp])
-        elif temp_count == 1:
-            temperatures.extend([temp])
+        temp_count = temp_counts[temp]
+        if temp_count in (0, 1):
+            temp_counts[temp] = 2
         elif temp_count == 2:
             # 二つ含まれる場合は何もしない。
             pass
         else:
             raise ValueError(f'同じ値が3つ以上含まれます。値: {temp_count}')
 
+    temperatures = [
+        temp for temp, count in temp_counts.items() for _ in range(count)
+    ]
+    temperatures.sort()
     return temperatures
 
 
 def accumulate_heats(
-    temperature_ranges_: list[TemperatureRange],
+    temperature_ranges: list[TemperatureRange],
     temperature_range_heats: dict[TemperatureRange, float]
-) -> list[float]:
+) -> array:
     """温度領域ごとの必要熱量から全体で必要な熱量を求めます。
 
     Args:
-        temperature_ranges_ (list[TemperatureRange]): 温度領域のリスト。
+        temperature_ranges (list[TemperatureRange]):
+            温度領域のリスト(昇順)。get_temperature_range_heatsの返す温度領域は
+            昇順であるため、そのまま渡すことができます。
         temperature_range_heats (dict[TemperatureRange, float]):
             温度領域ごとの必要熱量。
 
     Returns:
-        list[float]: 温度領域ごとの必要熱量を集計した結果。
+        array: 温度領域ごとの必要熱量を集計した結果(倍精度のarray)。
     """
-    temperature_ranges = sorted(temperature_ranges_)
-    if temperature_ranges != (keys := sorted(list(temperature_range_heats.keys()))):
+    # キーの検証はソートせずにハッシュ探索で行う。
+    if len(temperature_ranges) != len(temperature_range_heats) or any(
+        temp_range not in temperature_range_heats
+        for temp_range in temperature_ranges
+    ):
         raise ValueError(
             'temperature_range_heatsが不正です。'
             f'必要なキー: {temperature_ranges} '
-            f'存在するキー: {keys}'
+            f'存在するキー: {sorted(temperature_range_heats)}'
         )
 
-    heats = [0.0] * (len(temperature_ranges) + 1)
-    for i, temp_range in enumerate(temperature_ranges):
-        heats[i + 1] = heats[i] + temperature_range_heats[temp_range]
-
-    return heats
+    # Pythonのfloatのリストよりも省メモリな倍精度のarrayとして返す。
+    return array('d', accumulate(
+        (temperature_range_heats[temp_range] for temp_range in temperature_ranges),
+        initial=0.0
+    ))
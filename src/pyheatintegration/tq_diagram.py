@@ -1,17 +1,18 @@
+import heapq
 import math
 from collections.abc import Callable
-from copy import copy, deepcopy
+from copy import copy
+from itertools import accumulate
+from operator import attrgetter
 from typing import Optional
 
 from .heat_range import (REL_TOL_DIGIT, HeatRange, flatten_heat_ranges,
-                         get_heat_ranges, get_merged_heat_ranges,
-                         merge_heat_range)
-from .plot_segment import PlotSegment, get_plot_segments, is_continuous
+                         get_merged_heat_ranges)
+from .plot_segment import (PlotSegment, get_plot_segments_fused,
+                           is_continuous)
 from .segment import Segment, Segments
 from .streams import Stream, get_temperature_range_heats
-from .temperature_range import (TemperatureRange, accumulate_heats,
-                                flatten_temperature_ranges,
-                                merge_temperature_range)
+from .temperature_range import TemperatureRange, flatten_temperature_ranges
 
 
 class TQDiagram:
@@ -41,15 +42,19 @@ class TQDiagram:
         minimum_approach_temp_diff: float,
         pinch_point_temp: float
     ):
-        hot_streams = sorted(
-            [stream for stream in streams if stream.is_hot()],
-            key=lambda stream: stream.output_temperature()
-        )
+        # 一度の走査で与熱流体と受熱流体に振り分ける。
+        hot_streams: list[Stream] = []
+        cold_streams: list[Stream] = []
+        for stream in streams:
+            if stream.is_hot():
+                hot_streams.append(stream)
+            else:
+                cold_streams.append(stream)
 
-        cold_streams = sorted(
-            [stream for stream in streams if stream.is_cold()],
-            key=lambda stream: stream.input_temperature()
-        )
+        # 与熱流体の出口温度・受熱流体の入り口温度はいずれも温度範囲の開始値である。
+        # C実装のattrgetterを用いてメソッド呼び出しを省く。
+        hot_streams.sort(key=attrgetter('temperature_range.start'))
+        cold_streams.sort(key=attrgetter('temperature_range.start'))
 
         # 与熱複合線と受熱複合線を得た後に、最小接近温度差を満たすようにずらす。
         hcc, ccc = _shift_curve(
@@ -80,21 +85,49 @@ class TQDiagram:
         self.cold_lines_merged = [plot_segment.line() for plot_segment in self.ccc_merged]
 
 
+# 複合線のキャッシュ。get_possible_minimum_temp_diff_rangeを呼んだ後にTQDiagramを
+# 生成する流れでは同じ流体から複合線を複数回生成するため、直近の結果を保持する。
+_COMPOSITE_CURVE_CACHE_MAXSIZE = 8
+_composite_curve_cache: dict[tuple, list[PlotSegment]] = {}
+
+
 def _create_composite_curve(streams: list[Stream]) -> list[PlotSegment]:
     """受け取った流体から生成した複合線を返します。
 
+    結果は流体の値(id・熱量・温度範囲)をキーとしてキャッシュし、同じ流体のリストに
+    対しては再計算を行いません。返すプロットセグメントは呼び出しごとに複製します。
+
     Args:
         streams (list[Stream]): 流体のリスト。
 
     Returns:
         list[PlotSegment]: 複合線。
     """
-    t_ranges, t_range_heats = get_temperature_range_heats(streams)
-    t = flatten_temperature_ranges(t_ranges)
-    h = accumulate_heats(t_ranges, t_range_heats)
-    return [
-        PlotSegment(h[i], h[i + 1], t[i], t[i + 1]) for i in range(len(h) - 1)
-    ]
+    key = tuple(
+        (
+            stream.id_,
+            stream.heat_load,
+            stream.temperature_range.start,
+            stream.temperature_range.finish
+        ) for stream in streams
+    )
+
+    plot_segments = _composite_curve_cache.get(key)
+    if plot_segments is None:
+        # 温度領域と熱量は添字で対応したリストとして得られるため、辞書を介さずに
+        # そのまま累積する。
+        t_ranges, t_range_heats = get_temperature_range_heats(streams)
+        t = flatten_temperature_ranges(t_ranges)
+        h = list(accumulate(t_range_heats, initial=0.0))
+        plot_segments = [
+            PlotSegment(h0, h1, t0, t1)
+            for h0, h1, t0, t1 in zip(h, h[1:], t, t[1:])
+        ]
+        if len(_composite_curve_cache) >= _COMPOSITE_CURVE_CACHE_MAXSIZE:
+            _composite_curve_cache.pop(next(iter(_composite_curve_cache)))
+        _composite_curve_cache[key] = plot_segments
+
+    return [plot_segment.clone() for plot_segment in plot_segments]
 
 
 def _get_heat_at_pinch_point(
@@ -156,8 +189,12 @@ def _shift_curve(
     Raises:
         ValueError: 複合線が熱量に関して連続でない場合。
     """
-    hot_plot_segments = sorted(deepcopy(hot_plot_segments_))
-    cold_plot_segments = sorted(deepcopy(cold_plot_segments_))
+    hot_plot_segments = sorted(
+        plot_segment.clone() for plot_segment in hot_plot_segments_
+    )
+    cold_plot_segments = sorted(
+        plot_segment.clone() for plot_segment in cold_plot_segments_
+    )
 
     if is_continuous(hot_plot_segments) is not None \
        or is_continuous(cold_plot_segments) is not None:
@@ -212,59 +249,109 @@ def _get_segments(
         ]
     )
 
-    hot_heat_range_plot_segment: dict[HeatRange, PlotSegment] = {
-        s.heat_range: s for s in get_plot_segments(heat_ranges, hot_plot_segments)
-    }
-    cold_heat_range_plot_segment: dict[HeatRange, PlotSegment] = {
-        s.heat_range: s for s in get_plot_segments(heat_ranges, cold_plot_segments)
-    }
+    # get_plot_segments_fusedの結果はheat_rangesの部分列と熱量領域が一致した昇順のリストと
+    # なるため、辞書を構築せずに添字を進めながら対応付けを行う。
+    aligned_hot_plot_segments = get_plot_segments_fused(heat_ranges, hot_plot_segments)
+    aligned_cold_plot_segments = get_plot_segments_fused(heat_ranges, cold_plot_segments)
+
+    # 複合線の温度は熱量に関して単調非減少であるため、温度範囲の開始値でソートした流体を
+    # 二つの添字で掃引し、セグメントを含む流体を線形時間で求める。開始値が現在の開始温度
+    # 以下になった流体を候補に加え、終了値が現在の終了温度を下回った流体は以降のセグメント
+    # にも対応しないため候補から外す。
+    sorted_hot_streams = sorted(
+        hot_streams, key=attrgetter('temperature_range.start')
+    )
+    sorted_cold_streams = sorted(
+        cold_streams, key=attrgetter('temperature_range.start')
+    )
+    active_hot_streams: list[Stream] = []
+    active_cold_streams: list[Stream] = []
+    hot_stream_index = 0
+    cold_stream_index = 0
 
     segments: Segments = Segments()
+    hot_index = 0
+    cold_index = 0
     for heat_range in heat_ranges:
-        hot_plot_segment = hot_heat_range_plot_segment.get(heat_range, None)
+        # 境界の熱量の差が許容誤差未満の場合、同じ熱量領域に複数のプロットセグメントが
+        # 対応することがあるため、開始値が一致する間は読み進め、辞書を用いた場合と同様に
+        # 最後のものを採用する。
+        hot_plot_segment = None
+        while hot_index < len(aligned_hot_plot_segments) \
+                and aligned_hot_plot_segments[hot_index].start_heat() == heat_range.start:
+            hot_plot_segment = aligned_hot_plot_segments[hot_index]
+            hot_index += 1
+
         hot_temperatures: Optional[tuple[float, float]] = None
         hot_streams_: list[Stream] = []
         if hot_plot_segment is not None:
             hot_temp_range = hot_plot_segment.temperature_range
             hot_temperatures = hot_temp_range()
-
-            for stream_ in hot_streams:
-                if stream_.contain_temperatures(hot_temperatures):
+            start_temp, finish_temp = hot_temperatures
+            # 属性参照を流体ごとに繰り返さないようにローカル変数に束縛する。
+            hot_delta_zero = hot_temp_range.delta == 0
+            heat_range_delta = heat_range.delta
+
+            while hot_stream_index < len(sorted_hot_streams) \
+                    and sorted_hot_streams[hot_stream_index].temperature_range.start <= start_temp:
+                active_hot_streams.append(sorted_hot_streams[hot_stream_index])
+                hot_stream_index += 1
+            active_hot_streams = [
+                stream_ for stream_ in active_hot_streams
+                if stream_.temperature_range.finish >= finish_temp
+            ]
+
+            # 等温かどうかは流体ごとに不変のため、複製する前にキャッシュ済みのフラグで
+            # 判定し、採用する流体のみ複製する。
+            for stream_ in active_hot_streams:
+                if hot_delta_zero:
+                    if not stream_._is_isothermal:
+                        continue
                     stream = copy(stream_)
-                    if hot_temp_range.delta == 0:
-                        if stream.is_isothermal():
-                            stream.update_heat(heat_range.delta)
-                        else:
-                            continue
-                    else:
-                        if stream.is_isothermal():
-                            continue
-                        else:
-                            stream.update_temperature(*hot_temperatures)
-                    hot_streams_.append(stream)
-
-        cold_plot_segment = cold_heat_range_plot_segment.get(heat_range, None)
+                    stream.update_heat(heat_range_delta)
+                else:
+                    if stream_._is_isothermal:
+                        continue
+                    stream = copy(stream_)
+                    stream.update_temperature(*hot_temperatures)
+                hot_streams_.append(stream)
+
+        cold_plot_segment = None
+        while cold_index < len(aligned_cold_plot_segments) \
+                and aligned_cold_plot_segments[cold_index].start_heat() == heat_range.start:
+            cold_plot_segment = aligned_cold_plot_segments[cold_index]
+            cold_index += 1
+
         cold_temperatures: Optional[tuple[float, float]] = None
         cold_streams_: list[Stream] = []
         if cold_plot_segment is not None:
             cold_temp_range = cold_plot_segment.temperature_range
             cold_temperatures = cold_temp_range()
-
-            for stream_ in cold_streams:
-                if stream_.contain_temperatures(cold_temperatures):
+            start_temp, finish_temp = cold_temperatures
+            cold_delta_zero = cold_temp_range.delta == 0
+            heat_range_delta = heat_range.delta
+
+            while cold_stream_index < len(sorted_cold_streams) \
+                    and sorted_cold_streams[cold_stream_index].temperature_range.start <= start_temp:
+                active_cold_streams.append(sorted_cold_streams[cold_stream_index])
+                cold_stream_index += 1
+            active_cold_streams = [
+                stream_ for stream_ in active_cold_streams
+                if stream_.temperature_range.finish >= finish_temp
+            ]
+
+            for stream_ in active_cold_streams:
+                if cold_delta_zero:
+                    if not stream_._is_isothermal:
+                        continue
                     stream = copy(stream_)
-
-                    if cold_temp_range.delta == 0:
-                        if stream.is_isothermal():
-                            stream.update_heat(heat_range.delta)
-                        else:
-                            continue
-                    else:
-                        if stream.is_isothermal():
-                            continue
-                        else:
-                            stream.update_temperature(*cold_temperatures)
-                    cold_streams_.append(stream)
+                    stream.update_heat(heat_range_delta)
+                else:
+                    if stream_._is_isothermal:
+                        continue
+                    stream = copy(stream_)
+                    stream.update_temperature(*cold_temperatures)
+                cold_streams_.append(stream)
 
         segments.append(
             Segment(
@@ -291,20 +378,29 @@ def _merge_segments(
         tuple[list[PlotSegment], list[PlotSegment]]:
             与熱複合線と受熱複合線。
     """
-    segments = deepcopy(segments_)
-    hot_plot_segments = sorted([
-        plot_segment for segment in segments for plot_segment in segment.hot_plot_segments_split
-    ])
-    cold_plot_segments = sorted([
-        plot_segment for segment in segments for plot_segment in segment.cold_plot_segments_split
-    ])
-    heat_ranges = get_heat_ranges(
-        flatten_heat_ranges(
-            sorted([
-                heat_range for segment in segments for heat_range in segment.heat_ranges
-            ])
+    # セグメント全体をdeepcopyする必要はなく、戻り値に含まれ得るプロットセグメントのみ
+    # 複製すれば元のセグメントは変更されない。セグメントは熱量に関して昇順に並び、各
+    # セグメントの分割済みプロットセグメントもソート済みであるため、ソートし直さずに
+    # マージする。
+    hot_plot_segments = [
+        plot_segment.clone() for plot_segment in heapq.merge(
+            *(segment.hot_plot_segments_split for segment in segments_)
         )
-    )
+    ]
+    cold_plot_segments = [
+        plot_segment.clone() for plot_segment in heapq.merge(
+            *(segment.cold_plot_segments_split for segment in segments_)
+        )
+    ]
+    # セグメントは熱量に関して昇順に並び、各セグメントのheat_rangesもソート済みである
+    # ため、ソートし直さずにマージする。得られた境界値も昇順なので隣接する値を直接組に
+    # する。
+    heats = flatten_heat_ranges(list(heapq.merge(
+        *(segment.heat_ranges for segment in segments_)
+    )))
+    heat_ranges = [
+        HeatRange(start, finish) for start, finish in zip(heats, heats[1:])
+    ]
     heat_range_hot_plot_segment = {
         plot_segment.heat_range: plot_segment for plot_segment in hot_plot_segments
     }
@@ -312,49 +408,71 @@ def _merge_segments(
         plot_segment.heat_range: plot_segment for plot_segment in cold_plot_segments
     }
 
-    merged_heat_ranges: list[HeatRange] = []
+    # 結合可能な限り連を伸ばし、連ごとに一つの結合済みプロットセグメントを生成する。
+    # 隣接する二つずつを結合するのではなく一度の走査で最大限結合する。
+    merged_heat_ranges: set[HeatRange] = set()
     merged_hot_plot_segments: list[PlotSegment] = []
     merged_cold_plot_segments: list[PlotSegment] = []
-    for i in range(len(heat_ranges) - 1):
+    i = 0
+    n = len(heat_ranges)
+    while i < n:
         hot_plot_segment = heat_range_hot_plot_segment.get(heat_ranges[i], None)
         cold_plot_segment = heat_range_cold_plot_segment.get(heat_ranges[i], None)
-        next_hot_plot_segment = heat_range_hot_plot_segment.get(heat_ranges[i + 1], None)
-        next_cold_plot_segment = heat_range_cold_plot_segment.get(heat_ranges[i + 1], None)
 
-        if hot_plot_segment is None \
-           or cold_plot_segment is None \
-           or next_hot_plot_segment is None \
-           or next_cold_plot_segment is None:
+        if hot_plot_segment is None or cold_plot_segment is None:
+            i += 1
             continue
 
-        if hot_plot_segment.mergiable(next_hot_plot_segment) \
-           and cold_plot_segment.mergiable(next_cold_plot_segment):
-            merged_heat_range = merge_heat_range(hot_plot_segment.heat_range, next_hot_plot_segment.heat_range)
-            merged_hot_temp_range = merge_temperature_range(hot_plot_segment.temperature_range, next_hot_plot_segment.temperature_range)
-            merged_cold_temp_range = merge_temperature_range(cold_plot_segment.temperature_range, next_cold_plot_segment.temperature_range)
+        last_hot_plot_segment = hot_plot_segment
+        last_cold_plot_segment = cold_plot_segment
+        j = i
+        while j + 1 < n:
+            next_hot_plot_segment = heat_range_hot_plot_segment.get(heat_ranges[j + 1], None)
+            next_cold_plot_segment = heat_range_cold_plot_segment.get(heat_ranges[j + 1], None)
+
+            if next_hot_plot_segment is None \
+               or next_cold_plot_segment is None \
+               or not last_hot_plot_segment.mergiable(next_hot_plot_segment) \
+               or not last_cold_plot_segment.mergiable(next_cold_plot_segment):
+                break
+
+            last_hot_plot_segment = next_hot_plot_segment
+            last_cold_plot_segment = next_cold_plot_segment
+            j += 1
+
+        if j > i:
+            # 連は熱量に関して連続であるため、先頭と末尾の値から結合後の領域が定まる。
             merged_hot_plot_segments.append(PlotSegment(
-                *merged_heat_range(),
-                *merged_hot_temp_range(),
+                hot_plot_segment.start_heat(),
+                last_hot_plot_segment.finish_heat(),
+                hot_plot_segment.start_temperature(),
+                last_hot_plot_segment.finish_temperature(),
                 hot_plot_segment.uuid,
                 hot_plot_segment.state,
                 hot_plot_segment.reboiler_or_reactor
             ))
             merged_cold_plot_segments.append(PlotSegment(
-                *merged_heat_range(),
-                *merged_cold_temp_range(),
+                cold_plot_segment.start_heat(),
+                last_cold_plot_segment.finish_heat(),
+                cold_plot_segment.start_temperature(),
+                last_cold_plot_segment.finish_temperature(),
                 cold_plot_segment.uuid,
                 cold_plot_segment.state,
                 cold_plot_segment.reboiler_or_reactor
             ))
-            merged_heat_ranges.extend([heat_ranges[i], heat_ranges[i + 1]])
+            merged_heat_ranges.update(heat_ranges[i:j + 1])
 
+        i = j + 1
+
+    # 結合されなかったプロットセグメントも結合済みのものも昇順に並んでいるため、二つの
+    # ソート済みリストのマージで十分。
     hot_plot_segments = [plot_segment for plot_segment in hot_plot_segments if plot_segment.heat_range not in merged_heat_ranges]
     cold_plot_segments = [plot_segment for plot_segment in cold_plot_segments if plot_segment.heat_range not in merged_heat_ranges]
 
-    hot_plot_segments.extend(merged_hot_plot_segments)
-    cold_plot_segments.extend(merged_cold_plot_segments)
-
-    return sorted(hot_plot_segments), sorted(cold_plot_segments)
+    return (
+        list(heapq.merge(hot_plot_segments, merged_hot_plot_segments)),
+        list(heapq.merge(cold_plot_segments, merged_cold_plot_segments))
+    )
 
 
 def get_possible_minimum_temp_diff_range(
@@ -370,20 +488,35 @@ def get_possible_minimum_temp_diff_range(
     Returns:
         float: 可能な最小接近温度差[℃]。
     """
+    # 一度の走査で与熱流体と受熱流体、およびそのうちの内部流体に振り分ける。
+    hot_streams: list[Stream] = []
+    cold_streams: list[Stream] = []
+    internal_hot_streams: list[Stream] = []
+    internal_cold_streams: list[Stream] = []
+    for stream in streams:
+        if stream.is_hot():
+            hot_streams.append(stream)
+            if stream.is_internal():
+                internal_hot_streams.append(stream)
+        else:
+            cold_streams.append(stream)
+            if stream.is_internal():
+                internal_cold_streams.append(stream)
+
     hot_maximum_temp = max(
-        stream.input_temperature() for stream in streams if stream.is_hot()
+        stream.input_temperature() for stream in hot_streams
     )
 
     hot_minimum_temp = min(
-        stream.output_temperature() for stream in streams if stream.is_hot()
+        stream.output_temperature() for stream in hot_streams
     )
 
     cold_maximum_temp = max(
-        stream.output_temperature() for stream in streams if stream.is_cold()
+        stream.output_temperature() for stream in cold_streams
     )
 
     cold_minimum_temp = min(
-        stream.input_temperature() for stream in streams if stream.is_cold()
+        stream.input_temperature() for stream in cold_streams
     )
 
     if ignore_validation:
@@ -395,12 +528,8 @@ def get_possible_minimum_temp_diff_range(
         )
 
     # 与熱流体と受熱流体のセグメントを得る。
-    initial_hcc = _create_composite_curve([
-        stream for stream in streams if stream.is_internal() and stream.is_hot()
-    ])
-    initial_ccc = _create_composite_curve([
-        stream for stream in streams if stream.is_internal() and stream.is_cold()
-    ])
+    initial_hcc = _create_composite_curve(internal_hot_streams)
+    initial_ccc = _create_composite_curve(internal_cold_streams)
 
     initial_heat_ranges = get_merged_heat_ranges(
         [
@@ -409,8 +538,8 @@ def get_possible_minimum_temp_diff_range(
         ]
     )
 
-    hcc = get_plot_segments(initial_heat_ranges, initial_hcc)
-    ccc = get_plot_segments(initial_heat_ranges, initial_ccc)
+    hcc = get_plot_segments_fused(initial_heat_ranges, initial_hcc)
+    ccc = get_plot_segments_fused(initial_heat_ranges, initial_ccc)
 
     hot_maximum_heat = max(s.finish_heat() for s in hcc)
     cold_maximum_heat = max(s.finish_heat() for s in ccc)
@@ -430,20 +559,29 @@ def get_possible_minimum_temp_diff_range(
         ]
     )
 
-    # 与熱流体と受熱流体を合わせた熱量領域に対応するセグメントを得る。
-    hot_heat_range_plot_segment: dict[HeatRange, PlotSegment] = {
-        plot_segment.heat_range: plot_segment
-        for plot_segment in get_plot_segments(heat_ranges, hcc)
-    }
-    cold_heat_range_plot_segment: dict[HeatRange, PlotSegment] = {
-        plot_segment.heat_range: plot_segment
-        for plot_segment in get_plot_segments(heat_ranges, ccc)
-    }
+    # 与熱流体と受熱流体を合わせた熱量領域に対応するセグメントを得る。どちらも
+    # heat_rangesの部分列と一致した昇順のリストとなるため、辞書を構築せずに添字を
+    # 進めながら対応付けを行う。
+    aligned_hot_plot_segments = get_plot_segments_fused(heat_ranges, hcc)
+    aligned_cold_plot_segments = get_plot_segments_fused(heat_ranges, ccc)
 
     minimum_minimum_approch_temp_diff = math.inf
+    hot_index = 0
+    cold_index = 0
     for heat_range in heat_ranges:
-        hot_plot_segment = hot_heat_range_plot_segment.get(heat_range, None)
-        cold_plot_segment = cold_heat_range_plot_segment.get(heat_range, None)
+        # 同じ熱量領域に複数のプロットセグメントが対応する場合があるため、開始値が
+        # 一致する間は読み進め、最後のものを採用する。
+        hot_plot_segment = None
+        while hot_index < len(aligned_hot_plot_segments) \
+                and aligned_hot_plot_segments[hot_index].start_heat() == heat_range.start:
+            hot_plot_segment = aligned_hot_plot_segments[hot_index]
+            hot_index += 1
+
+        cold_plot_segment = None
+        while cold_index < len(aligned_cold_plot_segments) \
+                and aligned_cold_plot_segments[cold_index].start_heat() == heat_range.start:
+            cold_plot_segment = aligned_cold_plot_segments[cold_index]
+            cold_index += 1
 
         if hot_plot_segment is None or cold_plot_segment is None:
             continue
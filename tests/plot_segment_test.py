@@ -2,6 +2,7 @@ import unittest
 
 from src.pyheatintegration.heat_range import HeatRange
 from src.pyheatintegration.plot_segment import (PlotSegment, get_plot_segments,
+                                                get_plot_segments_fused,
                                                 temp_diff)
 
 
@@ -25,7 +26,7 @@ class TestPlotSegmtn(unittest.TestCase):
             "PlotSegment(0.00, 100.00, 100.0, 300.0)"
         )
 
-        self.assertEqual(plot_segment.line(), ((0, 100), (100, 300)))
+        self.assertEqual(plot_segment.line(), (0, 100, 100, 300))
         self.assertEqual(plot_segment.heats(), (0, 100))
         self.assertEqual(plot_segment.start_heat(), 0)
         self.assertEqual(plot_segment.finish_heat(), 100)
@@ -88,5 +89,69 @@ class TestGetPlotSegments(unittest.TestCase):
         ])
 
 
+class TestGetPlotSegmentsFused(unittest.TestCase):
+
+    def test_get_plot_segments_fused(self):
+        heat_ranges = [
+            HeatRange(0, 10),
+            HeatRange(10, 20),
+            HeatRange(20, 50)
+        ]
+        plot_segments = [
+            PlotSegment(0, 20, 100, 200),
+            PlotSegment(20, 50, 200, 300)
+        ]
+
+        self.assertEqual(
+            get_plot_segments_fused(heat_ranges, plot_segments),
+            get_plot_segments(heat_ranges, plot_segments)
+        )
+
+    def test_get_plot_segments_fused_boundaries_within_eps(self):
+        # 熱量領域の境界とプロットセグメントの境界の差が許容誤差未満の場合、
+        # 許容誤差未満の幅の熱量領域が隣接する2つのプロットセグメントの両方に
+        # 含まれ、同じ熱量領域のプロットセグメントが複数生成される。
+        boundary = 390.0
+        boundary_below = 389.99999999999994
+
+        heat_ranges = [
+            HeatRange(0, boundary_below),
+            HeatRange(boundary_below, boundary),
+            HeatRange(boundary, 800)
+        ]
+        plot_segments = [
+            PlotSegment(0, boundary_below, 100, 200, 1),
+            PlotSegment(boundary_below, 800, 200, 300, 2)
+        ]
+
+        fused = get_plot_segments_fused(heat_ranges, plot_segments)
+
+        self.assertEqual(fused, get_plot_segments(heat_ranges, plot_segments))
+        self.assertEqual(len(fused), 4)
+        self.assertEqual(
+            [
+                plot_segment for plot_segment in fused
+                if plot_segment.heats() == (boundary_below, boundary)
+            ],
+            [fused[1], fused[2]]
+        )
+
+    def test_get_plot_segments_fused_zero_width_segment(self):
+        heat_ranges = [
+            HeatRange(0, 10),
+            HeatRange(10, 30)
+        ]
+        plot_segments = [
+            PlotSegment(0, 10, 100, 200, 1),
+            PlotSegment(10, 10, 200, 250, 2),
+            PlotSegment(10, 30, 250, 300, 3)
+        ]
+
+        self.assertEqual(
+            get_plot_segments_fused(heat_ranges, plot_segments),
+            get_plot_segments(heat_ranges, plot_segments)
+        )
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -31,7 +31,7 @@ class TestGetTemperatureTransition(unittest.TestCase):
 class TestAccumulateHeats(unittest.TestCase):
 
     def test_should_success(self):
-        self.assertEqual(accumulate_heats([
+        self.assertEqual(list(accumulate_heats([
             TemperatureRange(0, 10),
             TemperatureRange(10, 20),
             TemperatureRange(20, 30),
@@ -39,7 +39,7 @@ class TestAccumulateHeats(unittest.TestCase):
             TemperatureRange(20, 30): 30.0,
             TemperatureRange(0, 10): 10.0,
             TemperatureRange(10, 20): 20.0,
-        }), [
+        })), [
             0.0, 10.0, 30.0, 60.0
         ])
 